@@ -8,7 +8,7 @@ audio from the microphone and transcribes it locally without external APIs.
 ## Requirements Installation
 
 ```bash
-pip install sounddevice scipy faster-whisper numpy torch
+pip install sounddevice faster-whisper numpy
 ```
 
 ## Usage
@@ -23,16 +23,39 @@ Record for a specific duration:
 python local_asr.py --duration 30
 ```
 
-Use a specific whisper model size (options: tiny, base, small, medium, large):
+Use a specific whisper model size (options: tiny, base, small, medium, large, large-v2, large-v3, large-v3-turbo, distil-large-v3):
 ```bash
 python local_asr.py --model small
 ```
 
+For low-latency use on a GPU, large-v3-turbo gives large-model accuracy with a much
+smaller decoder:
+```bash
+python local_asr.py --model large-v3-turbo
+```
+
 Check for and download the latest model:
 ```bash
 python local_asr.py --download-latest
 ```
 
+Choose the CTranslate2 compute type (default: fastest type the hardware supports):
+```bash
+python local_asr.py --compute-type float16
+```
+
+Keep the model loaded in a background server so later runs skip the model load:
+```bash
+python local_asr.py --serve            # run the server in a separate terminal
+python local_asr.py --spawn-server     # or start it automatically if it is not running
+```
+Runs connect to a matching server automatically; pass `--no-server` to always load
+the model in-process.
+
+With `transformers[torch]` installed, each model is converted to CTranslate2 once at
+the chosen compute type and cached in `~/.cache/local_asr`; later runs load that copy.
+A failed conversion is not retried until you run with `--download-latest`.
+
 ## Features
 - Records audio from the microphone with configurable duration
 - Saves the audio locally in .wav format
@@ -44,31 +67,95 @@ python local_asr.py --download-latest
 
 import os
 import sys
+import json
 import time
+import socket
+import shutil
+import struct
+import threading
 import argparse
 import traceback
+import importlib.util
+import subprocess
+import socketserver
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-# Audio processing libraries
+def physical_core_count():
+    """Return the number of physical CPU cores, or None if it cannot be determined."""
+    try:
+        import psutil
+        return psutil.cpu_count(logical=False)
+    except ImportError:
+        return None
+
+# More than ~8 inference threads mostly adds contention, and logical cores
+# oversubscribe the OpenMP pool, so cap at min(8, physical cores). 0 keeps
+# CTranslate2's own default when the core count is unknown.
+PHYSICAL_CORES = physical_core_count()
+CPU_THREADS = min(8, PHYSICAL_CORES) if PHYSICAL_CORES else 0
+
+# Size the OpenMP/MKL pools to match; these must be set before numpy and
+# CTranslate2 are imported
+if CPU_THREADS:
+    os.environ.setdefault("OMP_NUM_THREADS", str(CPU_THREADS))
+    os.environ.setdefault("MKL_NUM_THREADS", str(CPU_THREADS))
+
+# Audio processing libraries; sounddevice and faster-whisper are imported in
+# the functions that use them so --help and server clients start quickly
 import numpy as np
-import sounddevice as sd
-from scipy.io.wavfile import write as write_wav
 
-# Import faster-whisper for transcription
-try:
-    from faster_whisper import WhisperModel, download_model
-except ImportError:
-    print("Error: faster-whisper is not installed. Please install it using:")
-    print("pip install faster-whisper")
-    sys.exit(1)
+# Sample rate faster-whisper expects for in-memory audio
+WHISPER_SAMPLE_RATE = 16000
+
+# Local cache of models pre-converted to CTranslate2 at a fixed quantization
+DEFAULT_MODEL_CACHE_DIR = os.path.join("~", ".cache", "local_asr")
+
+# Hugging Face checkpoints for sizes whose name differs from openai/whisper-<size>
+HF_MODEL_IDS = {
+    "large": "openai/whisper-large-v3",
+    "distil-large-v3": "distil-whisper/distil-large-v3",
+}
+
+# Default compute types per device, fastest first. On CPU, CTranslate2 runs
+# int8 through AVX-512/VNNI kernels where the processor has them.
+COMPUTE_TYPE_PREFERENCES = {
+    "cuda": ["int8_float16", "float16", "float32"],  # int8 weights, fp16 activations
+    "cpu": ["int8", "float32"],
+}
+
+# Address of the optional resident transcription server (see --serve)
+SERVER_HOST = "127.0.0.1"
+DEFAULT_SERVER_PORT = 8765
+
+def select_compute_type(device):
+    """
+    Pick the fastest compute type the device supports.
+    
+    Args:
+        device (str): Inference device ("cuda" or "cpu")
+        
+    Returns:
+        str: CTranslate2 compute type
+    """
+    import ctranslate2
+    
+    preferences = COMPUTE_TYPE_PREFERENCES[device]
+    # Reflects the CPU instruction set or GPU compute capability
+    supported = ctranslate2.get_supported_compute_types(device)
+    for compute_type in preferences:
+        if compute_type in supported:
+            return compute_type
+    return preferences[-1]
 
 # Check if CUDA is available
 def is_cuda_available():
+    # CTranslate2 ships with faster-whisper, so this avoids importing PyTorch
     try:
-        import torch
-        return torch.cuda.is_available()
-    except ImportError:
-        print("PyTorch not installed. Will use CPU for inference.")
+        import ctranslate2
+        return ctranslate2.get_cuda_device_count() > 0
+    except Exception as e:
+        print(f"Could not query CUDA devices ({e}). Will use CPU for inference.")
         return False
 
 def parse_arguments():
@@ -77,12 +164,31 @@ def parse_arguments():
     parser.add_argument("--duration", type=int, default=60, 
                         help="Duration to record audio in seconds (default: 60)")
     parser.add_argument("--model", type=str, default="base", 
-                        choices=["tiny", "base", "small", "medium", "large"],
+                        choices=["tiny", "base", "small", "medium", "large",
+                                 "large-v2", "large-v3", "large-v3-turbo", "distil-large-v3"],
                         help="Whisper model size to use (default: base)")
     parser.add_argument("--sample-rate", type=int, default=16000,
                         help="Audio sample rate in Hz (default: 16000)")
     parser.add_argument("--download-latest", action="store_true",
                         help="Check for and download the latest model")
+    parser.add_argument("--compute-type", type=str, default=None,
+                        choices=sorted({ct for types in COMPUTE_TYPE_PREFERENCES.values()
+                                        for ct in types}),
+                        help="CTranslate2 compute type (default: fastest supported type)")
+    parser.add_argument("--batch-size", type=int, default=8,
+                        help="Number of VAD chunks decoded per batch (default: 8)")
+    parser.add_argument("--beam-size", type=int, default=1,
+                        help="Beam size for decoding; 1 is greedy (default: 1, use 5 for higher accuracy)")
+    parser.add_argument("--word-timestamps", action="store_true",
+                        help="Compute word-level timestamps (slower)")
+    parser.add_argument("--serve", action="store_true",
+                        help="Keep the model loaded and serve transcription requests")
+    parser.add_argument("--port", type=int, default=DEFAULT_SERVER_PORT,
+                        help=f"Local port of the transcription server (default: {DEFAULT_SERVER_PORT})")
+    parser.add_argument("--spawn-server", action="store_true",
+                        help="Start a background transcription server if none is running")
+    parser.add_argument("--no-server", action="store_true",
+                        help="Always load the model in this process, ignoring any running server")
     
     args = parser.parse_args()
     return args
@@ -93,6 +199,22 @@ def create_output_directory(base_dir="recordings"):
         os.makedirs(base_dir)
     return base_dir
 
+def show_countdown(deadline, done):
+    """
+    Repaint a countdown on stderr until the deadline or until done is set.
+    
+    Args:
+        deadline (float): time.monotonic() value at which recording ends
+        done (threading.Event): Set when recording has finished
+    """
+    while True:
+        remaining = deadline - time.monotonic()
+        sys.stderr.write(f"\rRecording: {max(0, int(round(remaining)))} seconds remaining...")
+        sys.stderr.flush()
+        # Wake on the next whole second of the deadline rather than accumulating sleeps
+        if remaining <= 0 or done.wait(timeout=remaining % 1 or 1):
+            return
+
 def record_audio(duration, sample_rate):
     """
     Record audio from the microphone for the specified duration.
@@ -102,47 +224,87 @@ def record_audio(duration, sample_rate):
         sample_rate (int): Audio sample rate in Hz
         
     Returns:
-        np.ndarray: Recorded audio data
+        np.ndarray: Recorded mono int16 audio, shape (N,)
     """
     if duration <= 0:
         print("Error: Duration must be a positive integer.")
         sys.exit(1)
 
+    import sounddevice as sd
+    
     print(f"Recording audio for {duration} seconds...")
     print("Speak now...")
     
+    # Preallocate the whole recording and fill it from the stream callback
+    # int16 is the native capture format on most devices and is what we save
+    buffer = np.empty(int(duration * sample_rate), dtype=np.int16)
+    write_ptr = 0
+    finished = threading.Event()
+    
+    def callback(indata, frames, time_info, status):
+        nonlocal write_ptr
+        if status:
+            print(f"\nAudio stream status: {status}", file=sys.stderr)
+        frames = min(frames, len(buffer) - write_ptr)
+        buffer[write_ptr:write_ptr + frames] = indata[:frames, 0]
+        write_ptr += frames
+        if write_ptr >= len(buffer):
+            finished.set()
+            raise sd.CallbackStop()
+    
     try:
-        # Record audio
-        audio_data = sd.rec(
-            int(duration * sample_rate),
+        with sd.InputStream(
             samplerate=sample_rate,
             channels=1,
-            dtype=np.float32
-        )
-        
-        # Display a countdown timer
-        for remaining in range(duration, 0, -1):
-            sys.stdout.write(f"\rRecording: {remaining} seconds remaining...")
-            sys.stdout.flush()
-            time.sleep(1)
+            dtype="int16",
+            blocksize=sample_rate // 10,  # 100 ms blocks
+            callback=callback
+        ):
+            deadline = time.monotonic() + duration
+            countdown = threading.Thread(target=show_countdown, args=(deadline, finished),
+                                         daemon=True)
+            countdown.start()
+            # Block until the buffer is full, allowing a little slack for the final block
+            finished.wait(timeout=duration + 1)
+            finished.set()
+            countdown.join()
             
         print("\nRecording complete.")
         
-        # Wait for recording to complete
-        sd.wait()
-        
-        return audio_data
+        return buffer[:write_ptr]
     except Exception as e:
         print(f"Error recording audio: {e}")
         traceback.print_exc()
         sys.exit(1)
 
+def write_wav(filename, sample_rate, audio_int16):
+    """
+    Write mono 16-bit PCM samples to a WAV file.
+    
+    Args:
+        filename (str): Path of the WAV file to write
+        sample_rate (int): Audio sample rate in Hz
+        audio_int16 (np.ndarray): Mono int16 audio samples
+    """
+    # WAV data is little-endian; this is a no-op on little-endian hosts
+    samples = np.ascontiguousarray(audio_int16, dtype="<i2")
+    data_size = samples.nbytes
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,  # PCM, mono, 16-bit
+        b"data", data_size
+    )
+    with open(filename, "wb") as f:
+        f.write(header)
+        samples.tofile(f)
+
 def save_audio(audio_data, sample_rate, output_dir):
     """
     Save the recorded audio to a WAV file.
     
     Args:
-        audio_data (np.ndarray): Audio data to save
+        audio_data (np.ndarray): Mono int16 audio data to save
         sample_rate (int): Audio sample rate in Hz
         output_dir (str): Directory to save the audio file
         
@@ -153,11 +315,8 @@ def save_audio(audio_data, sample_rate, output_dir):
     filename = os.path.join(output_dir, f"recording_{timestamp}.wav")
     
     try:
-        # Convert float32 to int16
-        audio_int16 = (audio_data * 32767).astype(np.int16)
-        
-        # Save as WAV file
-        write_wav(filename, sample_rate, audio_int16)
+        # Save as WAV file; the recording is already 16-bit PCM
+        write_wav(filename, sample_rate, audio_data)
         print(f"Audio saved to: {filename}")
         return filename
     except Exception as e:
@@ -165,111 +324,523 @@ def save_audio(audio_data, sample_rate, output_dir):
         traceback.print_exc()
         return None
 
-def load_whisper_model(model_size, download_latest=False):
+def prepare_audio(audio_data, sample_rate):
+    """
+    Convert recorded audio into the mono float32 16 kHz buffer faster-whisper expects.
+    
+    Args:
+        audio_data (np.ndarray): Recorded int16 audio data, shape (N,) or (N, 1)
+        sample_rate (int): Sample rate of the recorded audio in Hz
+        
+    Returns:
+        np.ndarray: Mono float32 audio at 16 kHz, shape (N,)
+    """
+    samples = np.ascontiguousarray(np.asarray(audio_data).reshape(-1), dtype=np.int16)
+    if sample_rate == WHISPER_SAMPLE_RATE or len(samples) == 0:
+        # Scale 16-bit PCM to [-1, 1) in a single new float32 buffer
+        audio = samples.astype(np.float32)
+        audio *= 1.0 / 32768.0
+        return audio
+    
+    # Resample with PyAV (a faster-whisper dependency), the same filtered
+    # resampler faster-whisper uses when decoding files, so content above
+    # 8 kHz does not alias into the speech band
+    import av
+    
+    frame = av.AudioFrame.from_ndarray(samples.reshape(1, -1), format="s16", layout="mono")
+    frame.sample_rate = sample_rate
+    frame.pts = 0
+    resampler = av.AudioResampler(format="flt", layout="mono", rate=WHISPER_SAMPLE_RATE)
+    # Passing None flushes the samples still buffered in the resampler
+    chunks = [out.to_ndarray().reshape(-1)
+              for source in (frame, None)
+              for out in resampler.resample(source)]
+    return np.concatenate(chunks).astype(np.float32, copy=False)
+
+def ensure_quantized_model(model_size, quantization, cache_dir=DEFAULT_MODEL_CACHE_DIR,
+                           force=False):
+    """
+    Convert a Whisper checkpoint to CTranslate2 at the given quantization, once.
+    
+    Requires `ct2-transformers-converter` plus transformers and torch
+    (pip install transformers[torch]); without them this returns None. A failed
+    conversion is remembered and only retried when force is set.
+    
+    Args:
+        model_size (str): Size of the model to convert
+        quantization (str): CTranslate2 quantization to store the weights in
+        cache_dir (str): Directory holding converted models
+        force (bool): Whether to reconvert even if a cached copy exists
+        
+    Returns:
+        str: Path to the converted model, or None if it could not be created
+    """
+    cache_dir = os.path.expanduser(cache_dir)
+    output_dir = os.path.join(cache_dir, f"{model_size}-{quantization}")
+    failed_marker = output_dir + ".failed"
+    if os.path.isdir(output_dir) and not force:
+        return output_dir
+    if os.path.exists(failed_marker) and not force:
+        return None
+    
+    # ctranslate2 always installs the converter script, but it only works
+    # when transformers and torch are importable
+    converter = shutil.which("ct2-transformers-converter")
+    if (converter is None or importlib.util.find_spec("transformers") is None
+            or importlib.util.find_spec("torch") is None):
+        return None
+    
+    hf_model_id = HF_MODEL_IDS.get(model_size, f"openai/whisper-{model_size}")
+    print(f"Converting {hf_model_id} to {quantization} (one-time)...")
+    # Convert into a temporary directory so an interrupted run leaves no partial cache
+    tmp_dir = output_dir + ".tmp"
+    try:
+        subprocess.run(
+            [converter, "--model", hf_model_id, "--output_dir", tmp_dir,
+             "--quantization", quantization, "--force",
+             "--copy_files", "tokenizer.json", "preprocessor_config.json"],
+            check=True
+        )
+        if os.path.isdir(output_dir):
+            shutil.rmtree(output_dir)
+        os.replace(tmp_dir, output_dir)
+        if os.path.exists(failed_marker):
+            os.remove(failed_marker)
+        return output_dir
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"Warning: model conversion failed ({e}). Using the downloadable model instead.")
+        print("Conversion will be retried with --download-latest.")
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(failed_marker, "w") as f:
+                f.write(f"{e}\n")
+        except OSError:
+            pass
+        return None
+
+def load_whisper_model(model_size, download_latest=False, compute_type=None):
     """
     Load the faster-whisper model.
     
     Args:
-        model_size (str): Size of the model to load (tiny, base, small, medium, large)
+        model_size (str): Size of the model to load (e.g. base, small, large-v3-turbo)
         download_latest (bool): Whether to check for and download the latest model
+        compute_type (str): CTranslate2 compute type, or None to pick one for the device
         
     Returns:
-        WhisperModel: Loaded faster-whisper model
+        tuple: (BatchedInferencePipeline wrapping the loaded WhisperModel,
+                compute type actually used)
     """
+    # Import faster-whisper for transcription
+    try:
+        from faster_whisper import BatchedInferencePipeline, WhisperModel, download_model
+    except ImportError:
+        print("Error: faster-whisper is not installed. Please install it using:")
+        print("pip install faster-whisper")
+        sys.exit(1)
+    
     # Determine device
     if is_cuda_available():
         print(f"CUDA is available. Using GPU for inference.")
         device = "cuda"
-        compute_type = "float16"  # For GPU
     else:
         print("CUDA is not available. Using CPU for inference.")
         device = "cpu"
-        compute_type = "int8"  # For CPU
+    
+    if compute_type is None:
+        compute_type = select_compute_type(device)
     
     try:
-        if download_latest:
-            print(f"Checking for latest {model_size} model and downloading if needed...")
-            # Use faster-whisper's download_model function to download/update model
-            download_model(model_size)
-            print("Latest model downloaded or already up to date.")
+        # Prefer a locally pre-quantized copy; --download-latest reconverts it
+        model_path = ensure_quantized_model(model_size, compute_type, force=download_latest)
+        if model_path is None:
+            model_path = model_size
+            if download_latest:
+                print(f"Checking for latest {model_size} model and downloading if needed...")
+                # Use faster-whisper's download_model function to download/update model
+                download_model(model_size)
+                print("Latest model downloaded or already up to date.")
         
-        print(f"Loading {model_size} model...")
-        model = WhisperModel(model_size, device=device, compute_type=compute_type)
+        print(f"Loading {model_size} model ({compute_type})...")
+        model = WhisperModel(model_path, device=device, compute_type=compute_type,
+                             cpu_threads=CPU_THREADS, num_workers=1)
         print(f"Model loaded successfully.")
-        return model
+        # The raw WhisperModel remains reachable as batched_model.model
+        return BatchedInferencePipeline(model=model), compute_type
     except Exception as e:
         print(f"Error loading Whisper model: {e}")
         traceback.print_exc()
         sys.exit(1)
 
-def transcribe_audio(model, audio_file):
+def transcribe_audio(model, audio, batch_size=8, beam_size=1, word_timestamps=False):
     """
     Transcribe audio using the faster-whisper model.
     
     Args:
-        model (WhisperModel): Initialized faster-whisper model
-        audio_file (str): Path to the audio file to transcribe
+        model (BatchedInferencePipeline): Batched faster-whisper pipeline
+        audio (np.ndarray): Mono float32 audio at 16 kHz, shape (N,)
+        batch_size (int): Number of VAD chunks decoded per batch
+        beam_size (int): Beam size for decoding (1 for greedy)
+        word_timestamps (bool): Whether to run the extra word-alignment pass
         
     Returns:
         str: Transcription result
     """
+    from faster_whisper.vad import VadOptions, get_speech_timestamps, merge_segments
+    
     try:
         print("Transcribing audio...")
         start_time = time.time()
         
-        # Run transcription with high accuracy settings
+        # Run VAD once here so a silent recording returns before the pipeline;
+        # speech regions are capped at the model's 30 s input window
+        vad_options = VadOptions(
+            min_silence_duration_ms=500,  # Filters pauses >500ms
+            max_speech_duration_s=model.model.feature_extractor.chunk_length
+        )
+        speech = get_speech_timestamps(audio, vad_options)
+        if not speech:
+            print("No speech detected.")
+            return ""
+        clip_timestamps = merge_segments(speech, vad_options)
+        
+        # Run transcription. The batched pipeline decodes each chunk once at
+        # temperature 0 with no fallback retries, so beam_size is the only
+        # accuracy/speed knob here.
         segments, info = model.transcribe(
-            audio_file,
-            beam_size=5,        # Increase beam size for better accuracy
-            word_timestamps=True,
-            vad_filter=True,    # Voice activity detection to filter out silence
-            vad_parameters=dict(min_silence_duration_ms=500)
+            audio,
+            batch_size=batch_size,  # Decode VAD chunks together instead of one by one
+            beam_size=beam_size,
+            word_timestamps=word_timestamps,
+            clip_timestamps=clip_timestamps,  # Speech regions found above
+            vad_filter=False    # VAD already ran; only the clipped regions are encoded
         )
         
-        # Collect segments
-        transcript = ""
-        for segment in segments:
-            transcript += segment.text + " "
+        # Collect segments (consumes the generator, which runs the decoding)
+        transcript = " ".join(segment.text.strip() for segment in segments)
         
         processing_time = time.time() - start_time
         print(f"Transcription completed in {processing_time:.2f} seconds.")
         
-        return transcript.strip()
+        return transcript
     except Exception as e:
         print(f"Error transcribing audio: {e}")
         traceback.print_exc()
         return "Transcription failed. Please check logs."
 
+class TranscriptionServer(socketserver.ThreadingTCPServer):
+    """
+    TCP server that keeps a loaded model resident between requests.
+    
+    Requests are handled on their own threads so pings are answered while the
+    model is loading or busy; transcriptions take turns on the shared model.
+    """
+    # On Windows SO_REUSEADDR would let a second server bind the same port
+    allow_reuse_address = os.name != "nt"
+    daemon_threads = True
+    
+    def __init__(self, address, model_size):
+        super().__init__(address, TranscriptionRequestHandler)
+        self.model_size = model_size
+        self.model = None
+        self.compute_type = None
+        self.ready = threading.Event()
+        self.model_lock = threading.Lock()
+    
+    def status(self):
+        """Return "loading", "busy" or "ready"."""
+        if not self.ready.is_set():
+            return "loading"
+        return "busy" if self.model_lock.locked() else "ready"
+
+class TranscriptionRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Handle one client request.
+    
+    Each request is a JSON header line, optionally followed by raw float32
+    samples. The response is a single JSON line.
+    """
+    
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+            if request.get("command") == "transcribe":
+                num_bytes = int(request["num_samples"]) * 4
+                payload = self.rfile.read(num_bytes)
+                if len(payload) != num_bytes:
+                    raise ValueError("Incomplete audio payload")
+                audio = np.frombuffer(payload, dtype=np.float32)
+                self.server.ready.wait()
+                with self.server.model_lock:
+                    transcript = transcribe_audio(self.server.model, audio,
+                                                  request.get("batch_size", 8),
+                                                  request.get("beam_size", 1),
+                                                  request.get("word_timestamps", False))
+                response = {"transcript": transcript}
+            else:
+                response = {"status": self.server.status(),
+                            "model": self.server.model_size,
+                            "compute_type": self.server.compute_type}
+        except Exception as e:
+            print(f"Error handling request: {e}")
+            traceback.print_exc()
+            response = {"error": str(e)}
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+def run_server(args):
+    """
+    Load the model once and serve transcription requests until interrupted.
+    
+    Args:
+        args (argparse.Namespace): Parsed command line arguments
+    """
+    # Bind before loading the model so a second server fails fast and clients
+    # see a loading server instead of spawning another one
+    try:
+        server = TranscriptionServer((SERVER_HOST, args.port), args.model)
+    except OSError as e:
+        print(f"Error: cannot listen on {SERVER_HOST}:{args.port} ({e}).")
+        sys.exit(1)
+    
+    def load_model():
+        try:
+            server.model, server.compute_type = load_whisper_model(
+                args.model, args.download_latest, args.compute_type)
+            server.ready.set()
+            print(f"Serving {args.model} model on {SERVER_HOST}:{args.port}. Press Ctrl+C to stop.")
+        except SystemExit:
+            # load_whisper_model has already reported the error
+            server.shutdown()
+    
+    with server:
+        print(f"Listening on {SERVER_HOST}:{args.port}; loading {args.model} model...")
+        threading.Thread(target=load_model, daemon=True).start()
+        server.serve_forever()
+    if not server.ready.is_set():
+        sys.exit(1)
+
+def send_server_request(port, request, payload=b"", connect_timeout=3.0, read_timeout=1.0):
+    """
+    Send a request to a running transcription server.
+    
+    Args:
+        port (int): Local port of the transcription server
+        request (dict): JSON-serialisable request header
+        payload (bytes-like): Raw data sent after the header
+        connect_timeout (float): Seconds to wait for the connection
+        read_timeout (float): Seconds to wait for the reply, or None to wait indefinitely
+        
+    Returns:
+        dict: Server response, or None if the listener did not answer
+        
+    Raises:
+        ConnectionRefusedError: If nothing is listening on the port
+    """
+    try:
+        with socket.create_connection((SERVER_HOST, port), timeout=connect_timeout) as sock:
+            # Pings must not hang on a listener that never replies, while
+            # transcription can legitimately take a while
+            sock.settimeout(read_timeout)
+            # The header and payload go out as separate writes, so disable Nagle
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            if payload:
+                sock.sendall(payload)
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+        return json.loads(line) if line else None
+    except ConnectionRefusedError:
+        raise
+    except (OSError, ValueError):
+        return None
+
+def ping_server(port):
+    """
+    Query the status of the transcription server on the given port.
+    
+    Args:
+        port (int): Local port of the transcription server
+        
+    Returns:
+        dict: Ping reply whose "status" is the server's "loading", "ready" or
+              "busy", or "refused" if nothing listens on the port, or
+              "unreachable" if the listener does not answer
+    """
+    try:
+        info = send_server_request(port, {"command": "ping"})
+    except ConnectionRefusedError:
+        return {"status": "refused"}
+    if info is None or "status" not in info:
+        return {"status": "unreachable"}
+    return info
+
+def server_matches(info, model_size, compute_type):
+    """
+    Check whether a running server holds the requested model.
+    
+    Args:
+        info (dict): Server response to a ping request
+        model_size (str): Requested model size
+        compute_type (str): Requested compute type, or None for the default
+        
+    Returns:
+        bool: True if the server serves the requested model
+    """
+    if info.get("model") != model_size:
+        return False
+    # A loading server has not resolved its compute type yet; recheck once ready
+    server_compute_type = info.get("compute_type")
+    return compute_type is None or server_compute_type in (None, compute_type)
+
+def spawn_server(args, output_dir):
+    """
+    Start a detached transcription server for the requested model.
+    
+    Args:
+        args (argparse.Namespace): Parsed command line arguments
+        output_dir (str): Directory for the server log file
+    """
+    command = [sys.executable, os.path.abspath(__file__), "--serve",
+               "--model", args.model, "--port", str(args.port)]
+    if args.compute_type:
+        command += ["--compute-type", args.compute_type]
+    if args.download_latest:
+        command.append("--download-latest")
+    
+    if os.name == "nt":
+        detach = {"creationflags": subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP}
+    else:
+        detach = {"start_new_session": True}
+    
+    log_path = os.path.join(output_dir, "server.log")
+    with open(log_path, "ab") as log_file:
+        subprocess.Popen(command, stdin=subprocess.DEVNULL, stdout=log_file,
+                         stderr=subprocess.STDOUT, **detach)
+    print(f"Started transcription server in the background (log: {log_path}).")
+
+def wait_for_server(port, startup_timeout=15):
+    """
+    Wait until the transcription server has loaded its model.
+    
+    A server that is still loading is waited for indefinitely; one that is
+    not listening yet is given startup_timeout seconds to bind its port.
+    
+    Args:
+        port (int): Local port of the transcription server
+        startup_timeout (float): Seconds to wait for the port to start accepting
+        
+    Returns:
+        dict: Ping reply of the ready (or busy) server, or None if it never came up
+    """
+    deadline = time.monotonic() + startup_timeout
+    while True:
+        info = ping_server(port)
+        status = info["status"]
+        if status in ("ready", "busy"):
+            return info
+        if status == "unreachable" or (status == "refused" and time.monotonic() > deadline):
+            return None
+        time.sleep(0.5)
+
+def transcribe_via_server(port, audio, batch_size=8, beam_size=1, word_timestamps=False):
+    """
+    Transcribe audio using a running transcription server.
+    
+    Args:
+        port (int): Local port of the transcription server
+        audio (np.ndarray): Mono float32 audio at 16 kHz, shape (N,)
+        batch_size (int): Number of VAD chunks decoded per batch
+        beam_size (int): Beam size for decoding (1 for greedy)
+        word_timestamps (bool): Whether to run the extra word-alignment pass
+        
+    Returns:
+        str: Transcription result, or None if the server could not be used
+    """
+    print("Transcribing audio on the resident server...")
+    audio = np.ascontiguousarray(audio, dtype=np.float32)
+    request = {"command": "transcribe", "num_samples": len(audio),
+               "batch_size": batch_size, "beam_size": beam_size,
+               "word_timestamps": word_timestamps}
+    # Send straight from the array's memory rather than a bytes copy of it
+    try:
+        response = send_server_request(port, request, memoryview(audio), read_timeout=None)
+    except ConnectionRefusedError:
+        return None
+    if response is None or "transcript" not in response:
+        return None
+    return response["transcript"]
+
 def main():
     """Main function to run the ASR system."""
     try:
         # Parse command line arguments
         args = parse_arguments()
         
+        if args.serve:
+            run_server(args)
+            return
+        
         # Create output directory
         output_dir = create_output_directory()
         
+        # Prefer a resident server so the model is not reloaded on every run
+        use_server = False
+        if not args.no_server:
+            server_info = ping_server(args.port)
+            if server_info["status"] == "refused":
+                # Only start a server when nothing at all is listening on the port
+                if args.spawn_server:
+                    spawn_server(args, output_dir)
+                    use_server = True
+            elif server_info["status"] == "unreachable":
+                print(f"Port {args.port} is in use but no transcription server answered; "
+                      "loading the model in-process instead.")
+            elif server_matches(server_info, args.model, args.compute_type):
+                use_server = True
+            else:
+                print(f"Server on port {args.port} serves a different model; "
+                      "loading the requested model in-process instead.")
+        
         # Load Whisper model
-        model = load_whisper_model(args.model, args.download_latest)
+        model = None
+        if not use_server:
+            model, _ = load_whisper_model(args.model, args.download_latest, args.compute_type)
         
         # Record audio
         audio_data = record_audio(args.duration, args.sample_rate)
         
-        # Save audio to file
-        audio_file = save_audio(audio_data, args.sample_rate, output_dir)
-        if not audio_file:
-            print("Failed to save audio file. Exiting.")
-            sys.exit(1)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Save audio to file for archival in the background
+            save_future = executor.submit(save_audio, audio_data, args.sample_rate, output_dir)
             
-        # Transcribe audio
-        transcript = transcribe_audio(model, audio_file)
-        
-        # Display results
-        print("\n" + "="*50)
-        print("TRANSCRIPTION RESULT:")
-        print("="*50)
-        print(transcript)
-        print("="*50)
+            # Transcribe the in-memory buffer, skipping the WAV decode round-trip
+            audio = prepare_audio(audio_data, args.sample_rate)
+            transcript = None
+            if use_server:
+                # The server may still be loading (or converting) its model
+                server_info = wait_for_server(args.port)
+                if server_info and server_matches(server_info, args.model, args.compute_type):
+                    transcript = transcribe_via_server(args.port, audio, args.batch_size,
+                                                       args.beam_size, args.word_timestamps)
+                if transcript is None:
+                    print("Transcription server unavailable. Loading the model in-process.")
+            if transcript is None:
+                if model is None:
+                    model, _ = load_whisper_model(args.model, args.download_latest,
+                                                  args.compute_type)
+                transcript = transcribe_audio(model, audio, args.batch_size, args.beam_size,
+                                              args.word_timestamps)
+            
+            # Display results
+            print("\n" + "="*50)
+            print("TRANSCRIPTION RESULT:")
+            print("="*50)
+            print(transcript)
+            print("="*50)
+            
+            if not save_future.result():
+                print("Warning: failed to save audio file.")
         
     except KeyboardInterrupt:
         print("\nProcess interrupted by user. Exiting.")